@@ -1,28 +1,32 @@
 import operator
 import sys
-from itertools import product
 from pprint import pprint
-from random import shuffle, randint
 from typing import Optional
 
 import better_exceptions
+import numpy as np
 
 from fixedheap.heap import HeapFactory
 
 better_exceptions.hook()
 
+_RNG = np.random.default_rng()
 
-def type_aggregator(parts, aggr_func=sum):
+
+def type_aggregator(parts, aggr_func=None):
     def wrap(data):
-        return aggr_func(sum(data[a]) for a in parts)
+        # stack the selected parts once and reduce them in vectorized C
+        part_sums = np.asarray([data[a] for a in parts]).sum(axis=1)
+        return float(part_sums.sum() if aggr_func is None else aggr_func(part_sums))
 
     return wrap
 
 
 def get_random_list(random_range, data_size):
-    data = [randint(*random_range) for i in range(data_size)]
-    shuffle(data)
-    return data
+    # one vectorized draw instead of data_size Python-level randint
+    # calls; the draw is already in random order so no shuffle needed
+    low, high = random_range
+    return _RNG.integers(low, high + 1, size=data_size)
 
 
 def get_random_data(
@@ -47,9 +51,10 @@ def get_random_data(
     return items
 
 
-def simple_usage(heap_type="max"):
+def simple_usage(heap_type="max", items=None):
     limit = 3
-    items = get_random_data(size=10, random_range=(0, 20))
+    if items is None:
+        items = get_random_data(size=10, random_range=(0, 20))
 
     for item in items.values():
         pprint(f"{item}, {sum(item)}")
@@ -58,26 +63,27 @@ def simple_usage(heap_type="max"):
     heap = HeapFactory.get(heap_type)(limit=limit, aggregator=lambda x: sum(x))
 
     # put data in heap; mark keys as items to get after heap
-    for key, data in items.items():
-        heap.append(key=(key, data), data=data)
+    heap.extend(((key, data), data) for key, data in items.items())
 
     check_heap(heap, heap_type, limit=limit)
+    return items
 
 
-def advanced_usage(heap_type="min"):
+def advanced_usage(heap_type="min", items=None):
     # start a max heap with limit 2 and set average aggregator
     limit = 10
-    items = get_random_data(
-        size=10, data_type=dict, keys=["east", "west", "north", "south"]
-    )
+    if items is None:
+        items = get_random_data(
+            size=10, data_type=dict, keys=["east", "west", "north", "south"]
+        )
 
     heap = HeapFactory.get(heap_type)(limit=limit, aggregator=lambda x: sum(x) / len(x))
 
     # put data in heap; mark keys as items to get after heap
-    for key, data in items.items():
-        heap.append(key=(key, data), data=data)
+    heap.extend(((key, data), data) for key, data in items.items())
 
     check_heap(heap, heap_type, limit=limit)
+    return items
 
 
 def check_heap(heap, heap_type, limit):
@@ -91,26 +97,27 @@ def check_heap(heap, heap_type, limit):
     for key, data in heap:
         agg = heap.aggregator(data)
         print(f"{key=}, {agg=}")
-        assert isinstance(agg, (float, int)), type(agg)
+        assert isinstance(agg, (float, int, np.number)), type(agg)
         assert operate(agg, start_value)
         start_value = agg
 
 
-def advanced_usage_2(heap_type="max"):
+def advanced_usage_2(heap_type="max", items=None):
     limit = 2
     # start a max heap with limit 2 and set average aggregator
-    keys = ["east", "west", "north", "south"]
-    items = get_random_data(data_type=dict, keys=keys, nested_dict=True)
+    if items is None:
+        keys = ["east", "west", "north", "south"]
+        items = get_random_data(data_type=dict, keys=keys, nested_dict=True)
 
     heap = HeapFactory.get(heap_type)(
         limit=limit, aggregator=type_aggregator(parts=["east", "south"])
     )
 
     # put data in heap; mark keys as items to get after heap
-    for key, data in items.items():
-        heap.append(key=(key, data), data=data)
+    heap.extend(((key, data), data) for key, data in items.items())
 
     check_heap(heap, heap_type, limit=limit)
+    return items
 
 
 def simple():
@@ -118,12 +125,13 @@ def simple():
 
 
 def all_cases():
-    for case, _type in product(
-        (simple_usage, advanced_usage, advanced_usage_2), ["max", "min", "max_heap", 'min_heap']
-    ):
-        if _type:
+    for case in (simple_usage, advanced_usage, advanced_usage_2):
+        # build each case's random dataset once and reuse it for every
+        # heap type instead of regenerating and re-aggregating per run
+        items = None
+        for _type in ("max", "min", "max_heap", "min_heap"):
             pprint(f"{case.__name__}, {_type}")
-            case(_type)
+            items = case(_type, items=items)
             pprint("=-" * 80)
 
 
@@ -1,55 +1,31 @@
-from abc import ABC, abstractmethod
-from collections import namedtuple
-from enum import Enum
-from heapq import nlargest, nsmallest, heappush
-from random import randint, random
-from typing import Any, Callable, List
+from array import array
+from heapq import heapify, heappush, heapreplace, nlargest
+from itertools import count
+from random import randrange, sample, shuffle
+from typing import Any, Callable, List, Tuple
+
+try:  # the max-heap primitives are public only since Python 3.14
+    from heapq import heapify_max as _heapify_max, heappop_max as _heappop_max
+except ImportError:  # pragma: no cover
+    from heapq import _heapify_max, _heappop_max
+
+try:  # numpy is optional: numeric aggregators run vectorized with it
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:  # numba is optional: when present, numeric aggregators run compiled
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
 
 __all__ = {"HeapFactory"}
 
 
-class HeapNode(namedtuple("HeapNode", "key value")):
-    """A lightweight class that saves data and maintain order"""
-
-    __slots__ = ()
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    def __lt__(self, other):
-        return self.value < other.value
-
-    def __repr__(self):
-        return f"Key={self.key}: Value={self.value}"
-
-
-class BaseSorter(ABC):
-    @classmethod
-    @abstractmethod
-    def append(cls, node: HeapNode, heap: "Heap"):
-        pass
-
-    @classmethod
-    @abstractmethod
-    def sort(cls, items, limit):
-        pass
-
-    @classmethod
-    def index(cls, func, items):
-        return func(enumerate(items), key=lambda n: n[1].value)[0]
-
-
-class Sorter(BaseSorter, ABC):
-    @classmethod
-    def append(cls, node: HeapNode, heap: "Heap"):
-        heap.nodes.append(node)
-        if heap.reached_limit():
-            cls.handle_limit(heap.nodes)
-
-    @classmethod
-    @abstractmethod
-    def handle_limit(cls, items: List[HeapNode]):
-        pass
+#: Heap entries are plain ``(value, counter, key)`` tuples: tuple
+#: comparison runs fully in C, and the unique per-heap counter breaks
+#: value ties before the (possibly unorderable) key is ever compared.
+HeapEntry = Tuple[Any, int, Any]
 
 
 class Aggregators:
@@ -57,35 +33,214 @@ class Aggregators:
     def sum(obj):
         return sum(obj)
 
+    @staticmethod
+    def mean(obj):
+        return sum(obj) / len(obj)
+
     @staticmethod
     def dummy(o):
         return o
 
 
-class Heap:
-    """Class of all fixed size heap types"""
+#: Maps a pure-Python aggregator to its fastest available twin
+#: (numba-compiled, else numpy-vectorized); empty without either
+_COMPILED_AGGREGATORS = {}
+
+if np is not None:
+    # np.add.reduce runs the whole reduction as one SIMD C loop instead
+    # of one bytecode-dispatched addition per element
+    def _np_sum(data):
+        return float(np.add.reduce(np.asarray(data)))
+
+    def _np_mean(data):
+        data = np.asarray(data)
+        return float(np.add.reduce(data) / data.size)
+
+    Aggregators.np_sum = staticmethod(_np_sum)
+    Aggregators.np_mean = staticmethod(_np_mean)
+    _COMPILED_AGGREGATORS = {
+        Aggregators.sum: Aggregators.np_sum,
+        Aggregators.mean: Aggregators.np_mean,
+    }
+
+if njit is not None:
+    # signatures are declared up front so compilation happens at import
+    # time rather than on the first append; cache=True reuses the machine
+    # code across processes
+    @njit("float64(float64[:])", cache=True)
+    def _compiled_sum(values):
+        total = 0.0
+        for value in values:
+            total += value
+        return total
+
+    @njit("float64(float64[:])", cache=True)
+    def _compiled_mean(values):
+        total = 0.0
+        for value in values:
+            total += value
+        return total / values.size
+
+    def _njit_sum(data):
+        return _compiled_sum(np.asarray(data, dtype=np.float64))
+
+    def _njit_mean(data):
+        return _compiled_mean(np.asarray(data, dtype=np.float64))
+
+    Aggregators.njit_sum = staticmethod(_njit_sum)
+    Aggregators.njit_mean = staticmethod(_njit_mean)
+    _COMPILED_AGGREGATORS.update(
+        {
+            Aggregators.sum: Aggregators.njit_sum,
+            Aggregators.mean: Aggregators.njit_mean,
+        }
+    )
 
-    def __init__(self, sorter: BaseSorter, limit: int, aggregator: Callable = None):
+
+class Heap:
+    """Base of all fixed size heap types
+
+    Subclasses provide _append/_append_identity, _push, _bulk_load and
+    _select; plain inheritance keeps ABCMeta's instantiation checks off
+    the per-append dispatch path.
+    """
+
+    # no per-instance __dict__: attribute access on the hot paths is a
+    # slot read, and each heap instance sheds ~100 bytes. "append" is a
+    # slot because __init__ binds the specialized variant to it.
+    __slots__ = ("nodes", "limit", "aggregator", "append", "_counter", "_keys")
+
+    def __init__(self, limit: int, aggregator: Callable = None, pure: bool = False):
+        # the fused append guards peek at nodes[0] once the heap is
+        # full, so a non-positive limit must be rejected up front
+        if limit < 1:
+            raise ValueError(f"limit must be a positive int, got {limit!r}")
         self.nodes = []
-        self.sorter = sorter
         self.limit = limit
-        self.aggregator = aggregator or Aggregators.dummy
+        aggregator = aggregator or Aggregators.dummy
+        aggregator = _COMPILED_AGGREGATORS.get(aggregator, aggregator)
+        if pure and aggregator is not Aggregators.dummy:
+            aggregator = self._memoized(aggregator)
+        self.aggregator = aggregator
+        # partial evaluation: the identity aggregator adds nothing, so
+        # pick the append flavour once here instead of per call
+        self.append = (
+            self._append_identity if aggregator is Aggregators.dummy else self._append
+        )
+        self._counter = count()
+        #: counter -> key payload for entries currently in the heap;
+        #: keeping keys out of the compared tuples means heapq only ever
+        #: compares (value, counter) pairs, the fastest C compare path
+        self._keys = {}
+
+    @staticmethod
+    def _memoized(aggregator: Callable, maxsize: int = 1024) -> Callable:
+        # data is usually an unhashable list/dict, so key by identity;
+        # each entry keeps its data alive so live ids are never recycled,
+        # and the FIFO cap stops a long-lived heap from pinning every
+        # data object it has ever seen
+        cache = {}
+
+        def wrapper(data):
+            hit = cache.get(id(data))
+            if hit is not None:
+                return hit[1]
+            value = aggregator(data)
+            if len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            cache[id(data)] = (data, value)
+            return value
+
+        return wrapper
 
     def reached_limit(self):
-        return self.limit < len(self)
+        """Whether the heap is full and appends have started evicting"""
+        return len(self) >= self.limit
 
-    def append(self, key: Any, data: Any):
-        """Add a new node to heap
+    def _append(self, key: Any, data: Any):
+        """Add a new node to heap (bound to ``append`` in ``__init__``)
 
         :param key: Node identifier: Data to get after heapify
         :param data: data to run heap on
         """
-        node = HeapNode(key=key, value=self.aggregator(data))
-        self.sorter.append(node, heap=self)
+        raise NotImplementedError
+
+    def _append_identity(self, key: Any, data: Any):
+        """``_append`` specialized for the identity aggregator: the data
+        is the value, so the aggregator call is skipped entirely"""
+        raise NotImplementedError
+
+    def _push(self, entry: HeapEntry):
+        """Add an already-aggregated entry, evicting per the heap policy"""
+        raise NotImplementedError
+
+    def _bulk_load(self, entries: List[HeapEntry]):
+        """Adopt a fresh batch of entries as the heap content"""
+        raise NotImplementedError
+
+    def extend(self, pairs):
+        """Bulk-add ``(key, data)`` pairs in one pass
+
+        :param pairs: iterable of ``(key, data)`` tuples
+        """
+        aggregator = self.aggregator
+        entries = [
+            (aggregator(data), c, key) for (key, data), c in zip(pairs, self._counter)
+        ]
+        # len(self), not nodes: the compact variants store their content
+        # elsewhere and must not have it replaced by the bulk path
+        if len(self):
+            push = self._push
+            for entry in entries:
+                push(entry)
+        else:
+            self._bulk_load(entries)
+
+    def build_from_arrays(self, keys, data_matrix):
+        """Build the heap from a columnar batch, replacing its content
+
+        The whole selection runs vectorized: one row-wise reduction plus
+        a single linear argpartition pass, instead of one aggregator
+        call and one heap push per row.
+
+        :param keys: sequence of node identifiers, one per row
+        :param data_matrix: 2D ``numpy`` array of shape
+            ``(len(keys), data_size)``, or a 1D array of ready values
+        """
+        values = data_matrix.sum(axis=1) if data_matrix.ndim == 2 else data_matrix
+        if len(values) <= self.limit:
+            idx = range(len(values))
+        else:
+            idx = self._select(values)
+        self._bulk_load([(values[i], c, keys[i]) for i, c in zip(idx, self._counter)])
+
+    def _select(self, values):
+        """Pick the ``limit`` row indices this heap type keeps"""
+        raise NotImplementedError
 
     def top_n(self):
-        for item in self.sorter.sort(self.nodes, self.limit):
-            yield item.key
+        # entries sort descending; MinHeap stores negated values so the
+        # same order comes out ascending by real value
+        for entry in sorted(self.nodes, reverse=True):
+            yield self._keys[entry[1]]
+
+    def top_n_stream(self):
+        """Yield keys in :meth:`top_n` order while draining the heap
+
+        Never materializes a sorted copy: entries are popped one at a
+        time through the C max-heap primitives, so callers that stop
+        early only pay O(log limit) per key. Consumes the heap.
+        """
+        nodes = self.nodes
+        _heapify_max(nodes)
+        try:
+            while nodes:
+                yield self._keys.pop(_heappop_max(nodes)[1])
+        finally:
+            # an abandoned stream leaves nodes max-ordered, which would
+            # silently corrupt later appends: restore the min-heap
+            if nodes:
+                heapify(nodes)
 
     def __iter__(self):
         yield from self.top_n()
@@ -94,83 +249,378 @@ class Heap:
         return len(self.nodes)
 
     def __repr__(self):
-        return f"Heap-{self.sorter.__class__.__name__}: [{len(self.nodes)}/{self.limit}]"
+        return f"{self.__class__.__name__}: [{len(self)}/{self.limit}]"
 
 
-class MinHeap(BaseSorter):
-    @classmethod
-    def append(cls, node: HeapNode, heap: "Heap"):
-        heappush(heap.nodes, node)
-        if heap.reached_limit():
-            heap.nodes.pop(cls.index(max, heap.nodes))  # O(limit)
+class MaxHeap(Heap):
+    """Keeps the ``limit`` largest entries as a min-heap: the root is
+    the smallest of the top-K and gets replaced by any larger newcomer"""
 
-    @classmethod
-    def sort(cls, items, limit):
-        return nsmallest(limit, items)
+    __slots__ = ()
 
+    # heappush/heapreplace are bound as default arguments so the hot
+    # append path skips the global lookup on every call
+    def _append(self, key: Any, data: Any, _push=heappush, _replace=heapreplace):
+        value = self.aggregator(data)
+        nodes = self.nodes
+        # compare the bare values: skips the tuple compare and, on a
+        # rejected append, the counter increment and entry allocation
+        if len(nodes) < self.limit:
+            c = next(self._counter)
+            self._keys[c] = key
+            _push(nodes, (value, c))
+        elif nodes[0][0] < value:
+            c = next(self._counter)
+            keys = self._keys
+            keys[c] = key
+            del keys[_replace(nodes, (value, c))[1]]  # O(log limit)
+
+    def _append_identity(self, key: Any, data: Any, _push=heappush, _replace=heapreplace):
+        nodes = self.nodes
+        if len(nodes) < self.limit:
+            c = next(self._counter)
+            self._keys[c] = key
+            _push(nodes, (data, c))
+        elif nodes[0][0] < data:
+            c = next(self._counter)
+            keys = self._keys
+            keys[c] = key
+            del keys[_replace(nodes, (data, c))[1]]
+
+    def _push(self, entry: HeapEntry, _push=heappush, _replace=heapreplace):
+        value, c, key = entry
+        nodes = self.nodes
+        if len(nodes) < self.limit:
+            self._keys[c] = key
+            _push(nodes, (value, c))
+        elif nodes[0][0] < value:
+            keys = self._keys
+            keys[c] = key
+            del keys[_replace(nodes, (value, c))[1]]
+
+    def _bulk_load(self, entries: List[HeapEntry]):
+        # O(n) heapify of a fresh batch instead of n * O(log n) pushes
+        if len(entries) > self.limit:
+            entries = nlargest(self.limit, entries)
+        self._keys = {c: key for _, c, key in entries}
+        self.nodes = [(value, c) for value, c, _ in entries]
+        heapify(self.nodes)
+
+    def _select(self, values):
+        return values.argpartition(-self.limit)[-self.limit :]
+
+
+class MinHeap(Heap):
+    """Keeps the ``limit`` smallest entries as a max-heap of negated
+    values: the root is the largest of the bottom-K and gets replaced by
+    any smaller newcomer"""
 
-class MaxHeap(BaseSorter):
-    @classmethod
-    def append(cls, node: HeapNode, heap: "Heap"):
-        heappush(heap.nodes, node)
-        if heap.reached_limit():
-            heap.nodes.pop(cls.index(min, heap.nodes))  # O(limit)
+    __slots__ = ()
+
+    def _append(self, key: Any, data: Any, _push=heappush, _replace=heapreplace):
+        value = -self.aggregator(data)
+        nodes = self.nodes
+        if len(nodes) < self.limit:
+            c = next(self._counter)
+            self._keys[c] = key
+            _push(nodes, (value, c))
+        elif nodes[0][0] < value:
+            c = next(self._counter)
+            keys = self._keys
+            keys[c] = key
+            del keys[_replace(nodes, (value, c))[1]]  # O(log limit)
+
+    def _append_identity(self, key: Any, data: Any, _push=heappush, _replace=heapreplace):
+        value = -data
+        nodes = self.nodes
+        if len(nodes) < self.limit:
+            c = next(self._counter)
+            self._keys[c] = key
+            _push(nodes, (value, c))
+        elif nodes[0][0] < value:
+            c = next(self._counter)
+            keys = self._keys
+            keys[c] = key
+            del keys[_replace(nodes, (value, c))[1]]
+
+    def _push(self, entry: HeapEntry, _push=heappush, _replace=heapreplace):
+        value, c, key = -entry[0], entry[1], entry[2]
+        nodes = self.nodes
+        if len(nodes) < self.limit:
+            self._keys[c] = key
+            _push(nodes, (value, c))
+        elif nodes[0][0] < value:
+            keys = self._keys
+            keys[c] = key
+            del keys[_replace(nodes, (value, c))[1]]
+
+    def _bulk_load(self, entries: List[HeapEntry]):
+        entries = [(-value, c, key) for value, c, key in entries]
+        if len(entries) > self.limit:
+            entries = nlargest(self.limit, entries)
+        self._keys = {c: key for _, c, key in entries}
+        self.nodes = [(value, c) for value, c, _ in entries]
+        heapify(self.nodes)
+
+    def _select(self, values):
+        return values.argpartition(self.limit - 1)[: self.limit]
+
+
+class RandomHeap(Heap):
+    """Keeps a uniformly random subset of ``limit`` entries via
+    Algorithm R reservoir sampling"""
+
+    __slots__ = ("_seen",)
+
+    def __init__(self, limit: int, aggregator: Callable = None, pure: bool = False):
+        super().__init__(limit, aggregator=aggregator, pure=pure)
+        self._seen = 0
+
+    def _append(self, key: Any, data: Any, _randrange=randrange):
+        entry = (self.aggregator(data), next(self._counter), key)
+        nodes = self.nodes
+        self._seen += 1
+        if len(nodes) < self.limit:
+            nodes.append(entry)
+        else:
+            # O(1) in-place slot replacement; every item seen so far
+            # ends up in the reservoir with probability limit/seen
+            j = _randrange(self._seen)  # nosec
+            if j < self.limit:
+                nodes[j] = entry
+
+    def _append_identity(self, key: Any, data: Any, _randrange=randrange):
+        entry = (data, next(self._counter), key)
+        nodes = self.nodes
+        self._seen += 1
+        if len(nodes) < self.limit:
+            nodes.append(entry)
+        else:
+            j = _randrange(self._seen)  # nosec
+            if j < self.limit:
+                nodes[j] = entry
+
+    def _push(self, entry: HeapEntry, _randrange=randrange):
+        nodes = self.nodes
+        self._seen += 1
+        if len(nodes) < self.limit:
+            nodes.append(entry)
+        else:
+            j = _randrange(self._seen)  # nosec
+            if j < self.limit:
+                nodes[j] = entry
+
+    def _bulk_load(self, entries: List[HeapEntry]):
+        self._seen = len(entries)
+        if len(entries) > self.limit:
+            entries = sample(entries, self.limit)  # nosec
+        self.nodes = entries
+
+    def build_from_arrays(self, keys, data_matrix):
+        super().build_from_arrays(keys, data_matrix)
+        # _bulk_load only saw the limit rows that _select pre-sampled;
+        # the reservoir must weigh later appends against the full batch
+        self._seen = len(data_matrix)
+
+    def _select(self, values):
+        return sample(range(len(values)), self.limit)  # nosec
 
-    @classmethod
-    def sort(cls, items, limit):
-        return nlargest(limit, items)
+    def top_n(self):
+        # Fisher-Yates is O(n) in C vs O(n log n) random-key sorting
+        shuffle(self.nodes)  # nosec
+        for entry in self.nodes:
+            yield entry[2]
+
+    def top_n_stream(self):
+        nodes = self.nodes
+        shuffle(nodes)  # nosec
+        while nodes:
+            yield nodes.pop()[2]
+
+
+def _sift_root_down(values, keys, pos=0):
+    """Restore the min-heap invariant after replacing the root
+
+    Port of heapq._siftup that swaps the ``values`` array and the
+    parallel ``keys`` list together.
+    """
+    endpos = len(values)
+    startpos = pos
+    newvalue = values[pos]
+    newkey = keys[pos]
+    childpos = 2 * pos + 1
+    while childpos < endpos:
+        rightpos = childpos + 1
+        if rightpos < endpos and not values[childpos] < values[rightpos]:
+            childpos = rightpos
+        values[pos] = values[childpos]
+        keys[pos] = keys[childpos]
+        pos = childpos
+        childpos = 2 * pos + 1
+    values[pos] = newvalue
+    keys[pos] = newkey
+    _sift_up(values, keys, startpos, pos)
+
+
+def _sift_up(values, keys, startpos, pos):
+    """Bubble the item at ``pos`` toward the root (heapq._siftdown)"""
+    newvalue = values[pos]
+    newkey = keys[pos]
+    while pos > startpos:
+        parentpos = (pos - 1) >> 1
+        parentvalue = values[parentpos]
+        if newvalue < parentvalue:
+            values[pos] = parentvalue
+            keys[pos] = keys[parentpos]
+            pos = parentpos
+            continue
+        break
+    values[pos] = newvalue
+    keys[pos] = newkey
+
+
+def _heapify_parallel(values, keys):
+    """O(n) bottom-up heapify of the parallel values/keys sequences"""
+    for pos in reversed(range(len(values) // 2)):
+        _sift_root_down(values, keys, pos)
+
+
+class CompactMaxHeap(Heap):
+    """MaxHeap with structure-of-arrays storage for numeric values
+
+    Values live in a contiguous ``array('d')`` (8 bytes per entry
+    instead of a tuple object) and keys in a parallel list, so for large
+    limits the compare-critical values stay cache-resident. The sift
+    routines swap both sequences in lockstep.
+    """
+
+    __slots__ = ("_values",)
+
+    #: multiplied into stored values; -1 flips the heap into a min-heap
+    _sign = 1
+
+    def __init__(self, limit: int, aggregator: Callable = None, pure: bool = False):
+        super().__init__(limit, aggregator=aggregator, pure=pure)
+        self._values = array("d")
+        self._keys = []
+
+    def _append(self, key: Any, data: Any):
+        self._insert(self._sign * self.aggregator(data), key)
+
+    def _append_identity(self, key: Any, data: Any):
+        self._insert(self._sign * data, key)
+
+    def _insert(self, value, key):
+        values = self._values
+        keys = self._keys
+        if len(values) < self.limit:
+            values.append(value)
+            keys.append(key)
+            _sift_up(values, keys, 0, len(values) - 1)
+        elif values[0] < value:
+            values[0] = value
+            keys[0] = key
+            _sift_root_down(values, keys)
+
+    def _push(self, entry: HeapEntry):
+        self._insert(self._sign * entry[0], entry[2])
+
+    def _bulk_load(self, entries: List[HeapEntry]):
+        if len(entries) > self.limit:
+            sign = self._sign
+            entries = nlargest(self.limit, entries, key=lambda e: sign * e[0])
+        values = array("d", (self._sign * value for value, _, _ in entries))
+        keys = [key for _, _, key in entries]
+        _heapify_parallel(values, keys)
+        self._values = values
+        self._keys = keys
+
+    def _select(self, values):
+        if self._sign == 1:
+            return values.argpartition(-self.limit)[-self.limit :]
+        return values.argpartition(self.limit - 1)[: self.limit]
 
+    def top_n(self):
+        values = self._values
+        order = sorted(range(len(values)), key=values.__getitem__, reverse=True)
+        for i in order:
+            yield self._keys[i]
+
+    def top_n_stream(self):
+        """Yield keys in :meth:`top_n` order while draining the heap
+
+        Same contract and O(log limit)-per-key cost as the base stream:
+        the stored signs are flipped so the min-sift helpers pop
+        best-first, and abandoning the stream flips the leftovers back
+        into a valid resting heap, exactly like a smaller heap.
+        """
+        values = self._values
+        keys = self._keys
+        for i in range(len(values)):
+            values[i] = -values[i]
+        _heapify_parallel(values, keys)
+        try:
+            while values:
+                # pop the root before yielding so a consumed key is
+                # really gone even if the stream is then abandoned
+                key = keys[0]
+                last_value = values.pop()
+                last_key = keys.pop()
+                if values:
+                    values[0] = last_value
+                    keys[0] = last_key
+                    _sift_root_down(values, keys)
+                yield key
+        finally:
+            if values:
+                for i in range(len(values)):
+                    values[i] = -values[i]
+                _heapify_parallel(values, keys)
 
-class Min(Sorter):
-    @classmethod
-    def handle_limit(cls, items: List[HeapNode]):
-        items.pop(cls.index(max, items))  # O(limit)
+    def __len__(self):
+        return len(self._values)
 
-    @classmethod
-    def sort(cls, items, limit):
-        return nsmallest(limit, items)
 
+class CompactMinHeap(CompactMaxHeap):
+    """CompactMaxHeap with negated values, keeping the smallest entries"""
 
-class Max(Sorter):
-    @classmethod
-    def handle_limit(cls, items: List[HeapNode]):
-        items.pop(cls.index(min, items))  # O(limit)
+    __slots__ = ()
 
-    @classmethod
-    def sort(cls, items, limit):
-        return nlargest(limit, items)
+    _sign = -1
 
 
-class Random(Sorter):
-    @classmethod
-    def handle_limit(cls, items: List):
-        items.pop(randint(0, len(items) - 1))  # nosec
+def _make_ctor(heap_cls: type) -> Callable:
+    def ctor(limit, aggregator=None, pure=False) -> Heap:
+        return heap_cls(limit=limit, aggregator=aggregator, pure=pure)
 
-    @classmethod
-    def sort(cls, items, *_, **__):
-        # return a shuffle copy of heap
-        return sorted(items, key=lambda _: random())
+    return ctor
 
 
-class SortType(Enum):
-    MIN = Min
-    MAX = Max
-    MIN_HEAP = MinHeap
-    MAX_HEAP = MaxHeap
-    RANDOM = Random
+#: Frozen name -> ctor dispatch built once at import. Both spellings of
+#: every name are interned up front, so get() is a single dict hit with
+#: no string normalization or Enum machinery left on the hot path.
+_DISPATCH = {}
+for _heap_cls, _names in (
+    (MinHeap, ("min", "min_heap")),
+    (MaxHeap, ("max", "max_heap")),
+    (RandomHeap, ("random",)),
+    (CompactMinHeap, ("compact_min",)),
+    (CompactMaxHeap, ("compact_max",)),
+):
+    _ctor = _make_ctor(_heap_cls)
+    for _name in _names:
+        _DISPATCH[_name] = _DISPATCH[_name.upper()] = _ctor
 
 
 class _HeapFactory:
     __slots__ = {}
 
-    @classmethod
-    def get(cls, sort_type: str) -> Callable:
-        sorter = SortType[sort_type.upper()].value()
-
-        def ctor(limit, aggregator=None) -> Heap:
-            return Heap(sorter, limit=limit, aggregator=aggregator)
-
-        return ctor
+    @staticmethod
+    def get(sort_type: str) -> Callable:
+        try:
+            return _DISPATCH[sort_type]
+        except KeyError:
+            return _DISPATCH[sort_type.lower()]
 
 
 HeapFactory = _HeapFactory()